@@ -322,21 +322,15 @@ def setrun(claw_pkg='geoclaw'):
     # for gauges append lines of the form  [gaugeno, x, y, t1, t2]
     # rundata.gaugedata.add_gauge()
 
+    r = np.linspace(86., 93., 9) + .001  # shift a bit away from cell corners
+
     # gauges along x-axis:
-    gaugeno = 0
-    for r in np.linspace(86., 93., 9):
-        gaugeno = gaugeno+1
-        x = r + .001  # shift a bit away from cell corners
-        y = .001
-        rundata.gaugedata.gauges.append([gaugeno, x, y, 0., 1e10])
+    for gaugeno, x in zip(range(1, 10), r):
+        rundata.gaugedata.gauges.append([gaugeno, float(x), .001, 0., 1e10])
 
     # gauges along diagonal:
-    gaugeno = 100
-    for r in np.linspace(86., 93., 9):
-        gaugeno = gaugeno+1
-        x = (r + .001) / np.sqrt(2.)
-        y = (r + .001) / np.sqrt(2.)
-        rundata.gaugedata.gauges.append([gaugeno, x, y, 0., 1e10])
+    for gaugeno, xy in zip(range(101, 110), r / np.sqrt(2.)):
+        rundata.gaugedata.gauges.append([gaugeno, float(xy), float(xy), 0., 1e10])
     
 
     return rundata
@@ -12,7 +12,19 @@ import os
 from numpy import sqrt, ma
 import numpy
 from six.moves import range
-from clawpack.geoclaw import topotools
+
+# Layout of the fgmax*.txt output files, new format in v5.7.0.
+# Columns 0-4 are always x, y, level, B, h and the last column is
+# arrival_time.  The number of columns depends on num_fgmax_val, and for
+# each quantity q the table gives (q, column of q, column of q_time):
+fgmax_columns = {7:  [('h',4,5)],
+                 9:  [('h',4,6), ('s',5,7)],
+                 15: [('h',4,9), ('s',5,10), ('hs',6,11), ('hss',7,12),
+                      ('hmin',8,13)]}
+
+# possible arrays from GeoClaw output, converted to 2d by ps4_to_arrays:
+fgmax_zarrays = ('level','B','h','h_time','s','s_time','hs','hs_time',
+                 'hss','hss_time','hmin','hmin_time','arrival_time')
 
 
 class FGmaxGrid(object):
@@ -382,49 +394,18 @@ class FGmaxGrid(object):
             print('point_style == 4, found %i points ' % self.npts)
 
                     
-        # new format in v5.7.0, includes column for B = topo from aux array
-        cols_expected = [7,9,15]  
-                    
         ncols = d.shape[1]
         
-        if ncols not in cols_expected:
+        if ncols not in fgmax_columns:
             raise IOError("*** Unexpected number of columns %s in file %s" \
                     % (ncols, fname))
-    
-        ind_s = None
-        ind_hs = None
-        ind_hss = None
-        ind_hmin = None
-        ind_h_time = None
-        ind_s_time = None
-        ind_hs_time = None
-        ind_hss_time = None
-        ind_hmin_time = None
         
         ind_x = 0
         ind_y = 1
         ind_level = 2
         ind_B = 3  # added in new fname style
         ind_h = 4
-        if ncols == 7:
-            ind_h_time = 5
-            ind_arrival_time = 6
-        elif ncols == 9:
-            ind_s = 5
-            ind_h_time = 6
-            ind_s_time = 7
-            ind_arrival_time = 8
-        elif ncols == 15:
-            ind_s = 5
-            ind_hs = 6
-            ind_hss = 7
-            ind_hmin = 8
-            ind_h_time = 9
-            ind_s_time = 10
-            ind_hs_time = 11
-            ind_hss_time = 12
-            ind_hmin_time = 13
-            ind_arrival_time = 14
+        ind_arrival_time = ncols - 1
 
     
         if point_style in [0,1,4]:
@@ -437,38 +418,31 @@ class FGmaxGrid(object):
             raise NotImplementedError("Not implemented for point_style %s" \
                 % point_style)
     
-        X = numpy.reshape(d[:,0],fg_shape,order='F')
-        Y = numpy.reshape(d[:,1],fg_shape,order='F')
-        y0 = 0.5*(Y.min() + Y.max())   # mid-latitude for scaling plots
-        h = numpy.reshape(d[:,ind_h],fg_shape,order='F')
+        # reshape all columns at once, column k is then D[...,k]:
+        D = numpy.reshape(d, fg_shape + (ncols,), order='F')
+
+        # copy X,Y so no returned array is a view of d (masked_where copies
+        # the others), and d can be freed after reading:
+        X = D[...,ind_x].copy()
+        Y = D[...,ind_y].copy()
+        h = D[...,ind_h]
     
         # AMR level used for each fgmax value:
-        level = numpy.reshape(d[:,ind_level].astype('int'),fg_shape,order='F')
+        level = D[...,ind_level].astype('int')
         
         # Set B = topo array
-        B = numpy.reshape(d[:,ind_B],fg_shape,order='F')
+        B = D[...,ind_B]
     
         mask = (h < -1e50)  # points that were never set
         B = ma.masked_where(mask, B)
         h = ma.masked_where(mask, h)
 
-        def set_q_time(ind_q, ind_q_time):  
-            q = numpy.reshape(d[:,ind_q],fg_shape,order='F')
-            q = ma.masked_where(mask,q) 
-            q_time = numpy.reshape(d[:,ind_q_time],fg_shape,order='F')  
-            q_time = ma.masked_where(mask, q_time)      
-            return q, q_time
-    
-        self.h, self.h_time = set_q_time(ind_h, ind_h_time)
-        if ind_s:
-            self.s, self.s_time = set_q_time(ind_s, ind_s_time)
-        if ind_hs:
-            self.hs, self.hs_time = set_q_time(ind_hs, ind_hs_time)
-            self.hss, self.hss_time = set_q_time(ind_hss, ind_hss_time)
-            self.hmin, self.hmin_time = set_q_time(ind_hmin, ind_hmin_time)
+        for q, ind_q, ind_q_time in fgmax_columns[ncols]:
+            setattr(self, q, ma.masked_where(mask, D[...,ind_q]))
+            setattr(self, q + '_time', ma.masked_where(mask, D[...,ind_q_time]))
     
         # last column is arrival times:
-        arrival_time = numpy.reshape(d[:,ind_arrival_time],fg_shape,order='F')
+        arrival_time = D[...,ind_arrival_time]
         arrival_time = ma.masked_where(arrival_time < -1e50, arrival_time)  
         arrival_time = ma.masked_where(mask, arrival_time)
         self.arrival_time = arrival_time
@@ -521,6 +495,7 @@ class FGmaxGrid(object):
         """
         
         from numpy import ma
+        from clawpack.geoclaw import topotools
         assert self.point_style==4, '*** Requires point_style==4'
         
         if self.X.ndim==2 or self.Y.ndim==2:
@@ -541,25 +516,22 @@ class FGmaxGrid(object):
         x1 = X.min()
         y1 = Y.min()
             
-        # possible arrays from GeoClaw output to convert:           
-        zarrays = ['level','B','h','h_time','s','s_time','hs','hs_time',\
-                   'hss','hss_time','hmin','hmin_time','arrival_time']
-                    
         dx = X[0,1] - X[0,0]
         dy = Y[1,0] - Y[0,0]
         if verbose:
             print('Deduced dx = %g, dy = %g'  % (dx,dy))
+
+        # indices of each fgmax point in the 2d arrays, same for all attrs:
+        i_1d = numpy.round((x_1d-x1)/dx).astype(int)
+        j_1d = numpy.round((y_1d-y1)/dy).astype(int)
         
-        for attr in zarrays:
+        for attr in fgmax_zarrays:
             z_1d = getattr(self, attr, None)
             if z_1d is None:
                 if verbose: print('not converting attribute %s == None' % attr)
             else:
                 Z = ma.masked_array(data=numpy.empty(X.shape), mask=True)
-                for k in range(len(x_1d)):
-                    i = int(round((x_1d[k]-x1)/dx))
-                    j = int(round((y_1d[k]-y1)/dy))
-                    Z[j,i] = z_1d[k]
+                Z[j_1d,i_1d] = z_1d
                 if 0:
                     if not numpy.alltrue(mask == Z.mask):
                         print('*** converting to arrays gave unexpected mask for')
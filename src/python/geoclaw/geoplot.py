@@ -206,10 +206,10 @@ def surface_or_depth(current_data):
     q = current_data.q
     h = q[0,:,:]
     eta = q[3,:,:]
-    topo = eta - h
-    surface = ma.masked_where(h<=drytol, eta)
-    depth = ma.masked_where(h<=drytol, h)
-    surface_or_depth = where(topo<0, surface, depth)
+    # topo = eta - h < 0 exactly where eta < h, so compare directly rather
+    # than forming topo.  numpy.where drops the mask of masked arrays, so
+    # choose between eta and h first and then apply the dry mask once:
+    surface_or_depth = ma.masked_where(h<=drytol, where(eta<h, eta, h))
     return surface_or_depth
 
 # Some discrete color maps useful for contourf plots of fgmax results:
@@ -20,11 +20,15 @@ from clawpack.visclaw import geoplot, colormaps, plotpages
 # from plottools import fix_long_tick_labels
 
 import os
+import re
 from numpy import ma
 from clawpack.clawutil.data import ClawData
 from six.moves import range
 from six.moves import input
 
+# fixed grid output files are named fort.fgNN_FFFF
+regexp_fgframe = re.compile(r"fort\.fg\d{2}_(?P<frameno>\d{4})$")
+
 
 class ClawPlotFGData(ClawData):
 
@@ -65,17 +69,21 @@ class ClawPlotFGData(ClawData):
     def list_frames(self):
 
         import glob
-        pattern = "%s/fort.fg%s_*" % (self.outdir,str(self.fgno).zfill(2))
+        # frame files only, not e.g. fort.fgNN_arrivaltimes:
+        pattern = "%s/fort.fg%s_[0-9]*" % (self.outdir,str(self.fgno).zfill(2))
         files = glob.glob(pattern)
         if len(files) == 0:
             print('*** No files found of form ', pattern)
         framenos = []
         for file in files:
+            match = regexp_fgframe.match(os.path.basename(file))
+            if match is None:
+                print('*** Skipping unexpected file name ', file)
+                continue
             line = open(file,'r').readline()
             t = float(line.split()[0])
             print("%s: t = %s" % (file,t))
-            frameno = file[-2:]
-            framenos.append(int(frameno))
+            framenos.append(int(match.group('frameno')))
         return framenos
 
 
@@ -83,7 +91,8 @@ class ClawPlotFGData(ClawData):
 
         if frameno in self.solutions:
             # don't read if already in dictionary:
-            return self.grid, self.solutions[frameno]
+            solution = self.solutions[frameno]
+            return solution.grid, solution
 
         fname = "fort.fg%s_%s" % (str(self.fgno).zfill(2), str(frameno).zfill(4))
         fname = os.path.join(self.outdir,fname)
@@ -92,9 +101,6 @@ class ClawPlotFGData(ClawData):
             raise IOError("Missing fixed grid output file")
         
 
-        self.grid = ClawData()
-        grid = self.grid
-
         # Read parameters from header:
 
         file = open(fname,'r')
@@ -105,46 +111,60 @@ class ClawPlotFGData(ClawData):
         print('   Frame %s at t = %s' % (frameno,t))
 
         line = file.readline()
-        grid.mx = int(line.split()[0])
+        mx = int(line.split()[0])
 
         line = file.readline()
-        grid.my = int(line.split()[0])
+        my = int(line.split()[0])
 
         line = file.readline()
-        grid.xlow = float(line.split()[0])
+        xlow = float(line.split()[0])
 
         line = file.readline()
-        grid.ylow = float(line.split()[0])
+        ylow = float(line.split()[0])
 
         line = file.readline()
-        grid.xhi = float(line.split()[0])
+        xhi = float(line.split()[0])
 
         line = file.readline()
-        grid.yhi = float(line.split()[0])
+        yhi = float(line.split()[0])
 
         file.close()
 
-        grid.x = linspace(grid.xlow, grid.xhi, grid.mx+1)
-        grid.y = linspace(grid.ylow, grid.yhi, grid.my+1)
-        grid.dx = grid.x[1]-grid.x[0]
-        grid.dy = grid.y[1]-grid.y[0]
-        grid.xcenter = grid.x[:-1] + grid.dx/2.
-        grid.ycenter = grid.y[:-1] + grid.dy/2.
+        # Frames normally share one grid, set up each distinct grid once:
+        grid_key = (mx, my, xlow, ylow, xhi, yhi)
+        if grid_key not in self.grids:
+            grid = ClawData()
+            grid.mx = mx
+            grid.my = my
+            grid.xlow = xlow
+            grid.ylow = ylow
+            grid.xhi = xhi
+            grid.yhi = yhi
+            grid.x = linspace(grid.xlow, grid.xhi, grid.mx+1)
+            grid.y = linspace(grid.ylow, grid.yhi, grid.my+1)
+            grid.dx = grid.x[1]-grid.x[0]
+            grid.dy = grid.y[1]-grid.y[0]
+            grid.xcenter = grid.x[:-1] + grid.dx/2.
+            grid.ycenter = grid.y[:-1] + grid.dy/2.
+            self.grids[grid_key] = grid
+
+        self.grid = grid = self.grids[grid_key]
 
         d = loadtxt(fname, skiprows=8)
 
         solution = ClawData()
+        solution.grid = grid
         solution.t = t
         solution.ncols = d.shape[1]
-        solution.h = reshape(d[:,0], (grid.my,grid.mx))
-        solution.B = reshape(d[:,3], (grid.my,grid.mx))
-        solution.eta = reshape(d[:,4], (grid.my,grid.mx))
+        # one pass over d gives a contiguous (ncols,my,mx) array,
+        # h, B, eta are views into it:
+        solution.fg = reshape(d.T, (solution.ncols,grid.my,grid.mx)).copy()
+        solution.h = solution.fg[0,:,:]
+        solution.B = solution.fg[3,:,:]
+        solution.eta = solution.fg[4,:,:]
         solution.surface = ma.masked_where(isnan(solution.eta),solution.eta)
         solution.land = ma.masked_where(solution.h>self.drytol,solution.B)
-        solution.fg = empty((solution.ncols,grid.my,grid.mx), dtype=float)
-        for col in range(solution.ncols):
-            solution.fg[col,:,:] = reshape(d[:,col],(grid.my,grid.mx))
-        
+
         self.solutions[frameno] = solution
         return grid, solution
 
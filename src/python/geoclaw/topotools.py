@@ -692,9 +692,11 @@ class Topography(object):
                         break
                 N[0] = data.shape[0] // N[1]
 
-                self._x = data[:N[1],0]
-                self._y = data[::N[1],1]
-                self._Z = numpy.flipud(data[:,2].reshape(N))
+                # copy out of data, and make Z contiguous rather than a
+                # negative-stride flipped view, so data is not kept alive:
+                self._x = data[:N[1],0].copy()
+                self._y = data[::N[1],1].copy()
+                self._Z = numpy.ascontiguousarray(numpy.flipud(data[:,2].reshape(N)))
                 dx = self.X[0,1] - self.X[0,0]
                 dy = self.Y[1,0] - self.Y[0,0]
                 self._delta = (dx,dy)
@@ -705,13 +707,16 @@ class Topography(object):
                                         # self._x, self._y, self._delta, 
                                         # and  self.grid_registration
 
+                # Z is made contiguous rather than kept as a negative-stride
+                # flipped view:
                 if abs(self.topo_type) == 2:
                     # Data is read in as a single column, reshape it
                     self._Z = numpy.loadtxt(self.path, skiprows=6).reshape(N[1],N[0])
-                    self._Z = numpy.flipud(self._Z)
+                    self._Z = numpy.ascontiguousarray(numpy.flipud(self._Z))
                 elif abs(self.topo_type) == 3:
                     # Data is read in starting at the top right corner
-                    self._Z = numpy.flipud(numpy.loadtxt(self.path, skiprows=6))
+                    self._Z = numpy.loadtxt(self.path, skiprows=6)
+                    self._Z = numpy.ascontiguousarray(numpy.flipud(self._Z))
         
                 if mask:
                     self._Z = numpy.ma.masked_values(self._Z, self.no_data_value, copy=False)
@@ -903,7 +908,8 @@ class Topography(object):
         return num_cells
 
     def write(self, path, topo_type=None, no_data_value=None, fill_value=None, 
-                header_style='geoclaw', Z_format="%15.7e", grid_registration=None):
+                header_style='geoclaw', Z_format="%15.7e", grid_registration=None,
+                chunksizes=None):
         r"""Write out a topography file to path of type *topo_type*.
 
         Writes out a topography file of topo type specified with *topo_type* or
@@ -937,6 +943,11 @@ class Topography(object):
            with `Z_format = "%7i"`, for example.
          - *grid_registration* (str) - 'lower', 'llcorner', 'llcenter' 
                 or None for defaults described above.
+         - *chunksizes* (tuple) - (nlat, nlon) chunk shape of the elevation
+           variable, only used for topo_type 4.  The default None leaves
+           the layout to netCDF4, e.g. a single contiguous block.  Set to
+           (1, len(self.x)) for row chunks, or to a shape aligned with the
+           block size of the target file system.
 
         """
 
@@ -1089,13 +1100,21 @@ class Topography(object):
                 lat.axis = "Y"
                 lat[:] = self.y
 
-                elevation = outfile.createVariable('elevation', 'f8',
-                    ('lat','lon',))
+                # keep single precision data (e.g. read from a float32
+                # netCDF DEM) in single precision rather than promoting:
+                if Z.dtype == numpy.float32:
+                    Z_dtype = 'f4'
+                else:
+                    Z_dtype = 'f8'
+                elevation = outfile.createVariable('elevation', Z_dtype,
+                    ('lat','lon',), chunksizes=chunksizes)
                 elevation.standard_name  = "height_above_reference_ellipsoid"
                 elevation.long_name  = "Elevation relative to sea level"
                 elevation.units  = "m"
-                elevation.scale_factor  = 1.0
-                elevation.add_offset  = 0.0
+                # give these the type of elevation, otherwise netCDF readers
+                # unpack f4 data to double precision:
+                elevation.scale_factor  = numpy.dtype(Z_dtype).type(1.0)
+                elevation.add_offset  = numpy.dtype(Z_dtype).type(0.0)
                 elevation.sdn_parameter_urn  = "SDN:P01::BATHHGHT"
                 elevation.sdn_parameter_name  = "Sea floor height (above mean sea level) {bathymetric height}"
                 elevation.sdn_uom_urn  = "SDN:P06:ULAA"
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import numpy
+
+import nose
+
+
+class CurrentData(object):
+    """Minimal stand-in for the current_data passed to plot functions."""
+
+    def __init__(self, q):
+        self.q = q
+        self.user = object()    # no drytol set, use geoplot.drytol_default
+
+
+def test_surface_or_depth():
+    r"""Check surface_or_depth masks dry cells on both sides of topo = 0"""
+
+    try:
+        import matplotlib
+    except ImportError:
+        raise nose.SkipTest("Skipping test since matplotlib not found.")
+
+    matplotlib.use("Agg")  # use image backend -- needed for Travis tests
+    import clawpack.geoclaw.geoplot as geoplot
+
+    # cells: wet with topo < 0, wet with topo > 0,
+    #        dry with topo < 0, dry with topo > 0
+    h = numpy.array([[2.0, 1.0, 0.0, 0.0]])
+    eta = numpy.array([[0.5, 3.0, -1.0, 2.0]])
+    q = numpy.zeros((4,) + h.shape)
+    q[0,:,:] = h
+    q[3,:,:] = eta
+
+    surface_or_depth = geoplot.surface_or_depth(CurrentData(q))
+
+    assert isinstance(surface_or_depth, numpy.ma.MaskedArray), \
+           "surface_or_depth did not return a masked array."
+    assert numpy.array_equal(numpy.ma.getmaskarray(surface_or_depth),
+                             [[False, False, True, True]]), \
+           "surface_or_depth did not mask the dry cells."
+    assert numpy.allclose(surface_or_depth.compressed(), [0.5, 1.0]), \
+           "surface_or_depth gave wrong values in the wet cells."
+
+
+if __name__ == "__main__":
+    test_surface_or_depth()
+    print("All tests passed.")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import sys
+import tempfile
+import shutil
+
+from six.moves import StringIO
+
+import nose
+
+
+def test_list_frames():
+    r"""Check list_frames reads 4 digit frame numbers and skips arrivaltimes"""
+
+    try:
+        import matplotlib
+    except ImportError:
+        raise nose.SkipTest("Skipping test since matplotlib not found.")
+
+    matplotlib.use("Agg")  # use image backend -- needed for Travis tests
+    import clawpack.geoclaw.plotfg as plotfg
+
+    temp_path = tempfile.mkdtemp()
+    stdout = sys.stdout
+
+    try:
+        for fname in ['fort.fg01_0123', 'fort.fg01_arrivaltimes']:
+            with open(os.path.join(temp_path, fname), 'w') as f:
+                f.write('   0.120000000000E+03  time\n')
+
+        fgdata = plotfg.ClawPlotFGData(fgno=1)
+        fgdata.outdir = temp_path
+
+        sys.stdout = StringIO()
+        framenos = fgdata.list_frames()
+        output = sys.stdout.getvalue()
+        sys.stdout = stdout
+
+        assert framenos == [123], \
+               "list_frames returned %s, expected [123]" % framenos
+        assert 'arrivaltimes' not in output, \
+               "list_frames reported the arrivaltimes file."
+
+    finally:
+        sys.stdout = stdout
+        shutil.rmtree(temp_path)
+
+
+if __name__ == "__main__":
+    test_list_frames()
+    print("All tests passed.")
@@ -197,11 +197,65 @@ def test_read_write_topo_bowl_hill():
 
 
 def test_netcdf():
-    r"""Test Python NetCDF formatted topography reading"""
+    r"""Test Python NetCDF formatted topography writing and reading"""
 
     temp_path = tempfile.mkdtemp()
 
     try:
+        import netCDF4
+
+        # Small bowl topography for checking the written variable
+        topo = topotools.Topography()
+        topo.x = numpy.linspace(-1.0, 3.0, 5)
+        topo.y = numpy.linspace( 0.0, 3.0, 4)
+        X, Y = numpy.meshgrid(topo.x, topo.y)
+        topo.Z = topo_bowl(X, Y)
+
+        # Write with row chunks and check the chunking and data
+        chunks_path = os.path.join(temp_path, "test_chunks.nc")
+        topo.write(chunks_path, topo_type=4, chunksizes=(1, len(topo.x)))
+        with netCDF4.Dataset(chunks_path, 'r') as nc_file:
+            elevation = nc_file.variables['elevation']
+            assert elevation.chunking() == [1, len(topo.x)], \
+                   "Chunk sizes %s do not match (1, %s)." \
+                   % (elevation.chunking(), len(topo.x))
+            # double precision Z is still written as f8
+            assert elevation.dtype == numpy.float64, \
+                   "Double precision Z written as %s." % elevation.dtype
+
+        chunks_topo = topotools.Topography(path=chunks_path)
+        chunks_topo.read()
+        assert numpy.allclose(topo.Z, chunks_topo.Z), \
+               "Chunked Z-arrays did not match."
+
+        # Single precision Z is written as f4, with the NaN and masked
+        # cells replaced by no_data_value and fill_value
+        Z32 = numpy.ma.masked_array(topo_bowl(X, Y).astype(numpy.float32))
+        Z32[0, 0] = numpy.nan
+        Z32[1, 1] = numpy.ma.masked
+        topo32 = topotools.Topography()
+        topo32.x = topo.x
+        topo32.y = topo.y
+        topo32.Z = Z32
+        f4_path = os.path.join(temp_path, "test_f4.nc")
+        topo32.write(f4_path, topo_type=4, fill_value=-8888.)
+        with netCDF4.Dataset(f4_path, 'r') as nc_file:
+            elevation = nc_file.variables['elevation']
+            assert elevation.dtype == numpy.float32, \
+                   "Single precision Z written as %s." % elevation.dtype
+            Z = numpy.ma.getdata(elevation[:, :])
+
+        assert Z.dtype == numpy.float32, \
+               "Single precision Z read back as %s." % Z.dtype
+        assert Z[0, 0] == topo32.no_data_value, \
+               "NaN value not replaced by no_data_value."
+        assert Z[1, 1] == -8888., \
+               "Masked value not replaced by fill_value."
+        valid = numpy.ones(Z.shape, dtype=bool)
+        valid[0, 0] = valid[1, 1] = False
+        assert numpy.array_equal(Z[valid], Z32.data[valid]), \
+               "Single precision Z-arrays did not match."
+
         # Fetch comparison data
         url = "".join(('https://raw.githubusercontent.com/rjleveque/geoclaw/',
                        '5f675256c043e59e5065f9f3b5bdd41c2901702c/src/python/',